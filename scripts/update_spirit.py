@@ -4,15 +4,20 @@
 Code Spirits - Update script for the repository spirit
 """
 
+import collections
 import json
 import datetime
+import email.utils
 import functools
+import html
 import random
 import re
 import os
+import string
 import sys
 import subprocess
 import time
+import types
 import urllib.request
 import urllib.error
 import urllib.parse
@@ -44,6 +49,93 @@ RETRY_BACKOFF_MULTIPLIER = 2
 # キャッシュの有効期限（秒） - デフォルト1時間
 CACHE_TTL = 3600
 
+# 出力ターゲット定義 (あとから追加可能)
+# 各エントリ: {"format": RENDERERS のキー, "path": リポジトリルートからの出力先}
+RENDER_TARGETS = [
+    {"format": "readme", "path": "README.md"},
+    {"format": "html", "path": "docs/index.html"},
+    {"format": "json_feed", "path": "docs/feed.json"},
+    {"format": "badge", "path": "docs/mood.svg"},
+]
+
+# 気分ごとのバッジの色
+MOOD_BADGE_COLORS = {
+    "cheerful": "#f9a825",
+    "energetic": "#fb8c00",
+    "optimistic": "#fdd835",
+    "focused": "#1e88e5",
+    "productive": "#43a047",
+    "neutral": "#9e9e9e",
+    "relaxed": "#26a69a",
+    "contemplative": "#5e35b1",
+    "peaceful": "#4fc3f7",
+    "sleepy": "#3949ab",
+    "mysterious": "#6a1b9a",
+    "dreamy": "#ec407a",
+    "calm": "#00897b",
+    "excited": "#e53935",
+}
+
+# 1回の更新で全ターゲットが共有する不変の状態スナップショット
+SpiritSnapshot = collections.namedtuple(
+    "SpiritSnapshot",
+    ["profile", "mood", "utterance", "news", "news_comment"],
+)
+
+# テンプレートと正規表現はモジュール読み込み時に一度だけコンパイルする
+_README_STATUS_PATTERN = re.compile(r'<!-- SPIRIT_STATUS_START -->.*?<!-- SPIRIT_STATUS_END -->', re.DOTALL)
+_README_LOG_PATTERN = re.compile(r'<!-- SPIRIT_LOG_START -->.*?<!-- SPIRIT_LOG_END -->', re.DOTALL)
+_README_NEWS_PATTERN = re.compile(r'<!-- SPIRIT_NEWS_START -->.*?<!-- SPIRIT_NEWS_END -->', re.DOTALL)
+_README_NEWS_ANCHOR_PATTERN = re.compile(r'<!--\s*SPIRIT_NEWS_ANCHOR\s*-->')
+_README_SEPARATOR_PATTERN = re.compile(r'\n---\s*\n')
+
+_HTML_TEMPLATE = string.Template("""<!DOCTYPE html>
+<html lang="ja">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>${name} - Code Spirits</title>
+  <link rel="alternate" type="application/feed+json" href="feed.json">
+</head>
+<body>
+  <main>
+    <h1>${name} 🌟</h1>
+    <p><img src="mood.svg" alt="spirit: ${mood}"></p>
+    <h2>精霊の現在の状態</h2>
+    <p><strong>気分</strong>: ${mood}</p>
+    <h2>精霊の言葉</h2>
+    <blockquote>${utterance}</blockquote>
+    <h2>精霊が届けるニュース</h2>
+    ${comment}
+    <ul>
+${news}
+    </ul>
+  </main>
+</body>
+</html>
+""")
+
+_HTML_NEWS_ITEM_TEMPLATE = string.Template(
+    '      <li><a href="${link}">${title}</a> (${source})</li>'
+)
+
+_HTML_NEWS_ITEM_NO_LINK_TEMPLATE = string.Template(
+    '      <li>${title} (${source})</li>'
+)
+
+_BADGE_TEMPLATE = string.Template(
+    """<svg xmlns="http://www.w3.org/2000/svg" width="${width}" height="20" role="img" aria-label="${label}: ${message}">
+  <title>${label}: ${message}</title>
+  <rect width="${label_width}" height="20" fill="#555"/>
+  <rect x="${label_width}" width="${message_width}" height="20" fill="${color}"/>
+  <g fill="#fff" text-anchor="middle" font-family="Verdana,Geneva,DejaVu Sans,sans-serif" font-size="11">
+    <text x="${label_x}" y="14">${label}</text>
+    <text x="${message_x}" y="14">${message}</text>
+  </g>
+</svg>
+"""
+)
+
 
 class APIValidationError(Exception):
     """Exception raised when API response validation fails.
@@ -236,7 +328,8 @@ def fetch_news(feeds=None, use_cache=True):
         use_cache: whether to use cached results if available (default: True)
 
     Returns:
-        list of {"source": str, "title": str, "link": str}
+        list of {"source": str, "title": str, "link": str}, plus
+        "published" (RFC 3339) when the feed provides a date
     """
     # キャッシュから読み込みを試みる
     if use_cache:
@@ -263,6 +356,23 @@ def fetch_news(feeds=None, use_cache=True):
     return articles
 
 
+def _parse_rss_date(text):
+    """Convert an RSS <pubDate> (RFC 822) to an RFC 3339 string.
+
+    Returns None when the date is missing or cannot be parsed.
+    """
+    if not text or not text.strip():
+        return None
+    try:
+        published = email.utils.parsedate_to_datetime(text.strip())
+    except (TypeError, ValueError):
+        return None
+    # "-0000" or a missing zone yields a naive datetime; RFC 3339 needs an offset
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=datetime.timezone.utc)
+    return published.isoformat()
+
+
 @retry_with_backoff()
 def _fetch_single_feed_with_retry(feed):
     """Fetch a single RSS feed with retry logic.
@@ -296,11 +406,15 @@ def _fetch_single_feed_with_retry(feed):
             link_el = item.find("link")
             if title_el is None or not title_el.text:
                 continue
-            articles.append({
+            article = {
                 "source": feed["name"],
                 "title": title_el.text.strip(),
                 "link": link_el.text.strip() if link_el is not None and link_el.text else "",
-            })
+            }
+            published = _parse_rss_date(item.findtext("pubDate"))
+            if published:
+                article["published"] = published
+            articles.append(article)
             count += 1
             if count >= max_items:
                 break
@@ -326,11 +440,16 @@ def _fetch_single_feed_with_retry(feed):
                 if href:
                     link_href = href.strip()
 
-            articles.append({
+            article = {
                 "source": feed["name"],
                 "title": title_el.text.strip(),
                 "link": link_href,
-            })
+            }
+            published = (entry.findtext(atom_ns + "published")
+                         or entry.findtext(atom_ns + "updated"))
+            if published and published.strip():
+                article["published"] = published.strip()
+            articles.append(article)
             count += 1
             if count >= max_items:
                 break
@@ -542,37 +661,70 @@ def _escape_md_link(text):
     return text.replace("[", "\\[").replace("]", "\\]")
 
 
-def update_readme(mood, utterance, news_items=None, news_comment=""):
-    """Update all dynamic sections of README.md in a single read/write cycle."""
-    readme_path = 'README.md'
+def _freeze_article(article):
+    """Return a read-only view of a news article dict."""
+    return types.MappingProxyType(dict(article))
+
+
+def build_snapshot(profile, mood, utterance, news_items, news_comment):
+    """Build the immutable state snapshot shared by every render target.
+
+    Args:
+        profile: spirit profile dict
+        mood: current mood
+        utterance: current utterance
+        news_items: list of news articles
+        news_comment: generated news comment
+
+    Returns:
+        SpiritSnapshot
+    """
+    return SpiritSnapshot(
+        profile=types.MappingProxyType(dict(profile or {})),
+        mood=mood,
+        utterance=utterance,
+        news=tuple(_freeze_article(a) for a in (news_items or [])),
+        news_comment=news_comment or "",
+    )
+
+
+def _replace_section(pattern, replacement, content):
+    """Replace a marker-delimited section without interpreting backslashes."""
+    return pattern.sub(lambda _match: replacement, content)
 
-    if not os.path.exists(readme_path):
-        return
 
-    with open(readme_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+def render_readme(snapshot, previous):
+    """Render README.md by rewriting its dynamic sections.
+
+    Returns None when README.md does not exist, so nothing is written.
+    """
+    if previous is None:
+        return None
+
+    content = previous
 
     # --- Spirit status ---
-    status_pattern = r'(<!-- SPIRIT_STATUS_START -->)(.*?)(<!-- SPIRIT_STATUS_END -->)'
-    new_status = f'<!-- SPIRIT_STATUS_START -->\n**気分**: {mood}\n<!-- SPIRIT_STATUS_END -->'
-    content = re.sub(status_pattern, new_status, content, flags=re.DOTALL)
+    content = _replace_section(
+        _README_STATUS_PATTERN,
+        f'<!-- SPIRIT_STATUS_START -->\n**気分**: {snapshot.mood}\n<!-- SPIRIT_STATUS_END -->',
+        content,
+    )
 
     # --- Spirit log ---
-    log_pattern = r'(<!-- SPIRIT_LOG_START -->)(.*?)(<!-- SPIRIT_LOG_END -->)'
-    new_log = f'<!-- SPIRIT_LOG_START -->\n> {utterance}\n<!-- SPIRIT_LOG_END -->'
-    content = re.sub(log_pattern, new_log, content, flags=re.DOTALL)
+    content = _replace_section(
+        _README_LOG_PATTERN,
+        f'<!-- SPIRIT_LOG_START -->\n> {snapshot.utterance}\n<!-- SPIRIT_LOG_END -->',
+        content,
+    )
 
     # --- News ---
-    if news_items is None:
-        news_items = []
-
-    if news_items:
+    if snapshot.news:
         lines = []
-        if news_comment:
-            for bq_line in news_comment.splitlines():
+        if snapshot.news_comment:
+            for bq_line in snapshot.news_comment.splitlines():
                 lines.append(f"> {bq_line}" if bq_line.strip() else ">")
             lines.append("")
-        for article in news_items:
+        for article in snapshot.news:
             title = _escape_md_link(article['title'])
             link = article.get("link", "")
             # Properly encode URLs to avoid breaking markdown links
@@ -588,26 +740,161 @@ def update_readme(mood, utterance, news_items=None, news_comment=""):
 
     new_section = f"<!-- SPIRIT_NEWS_START -->\n{news_body}\n<!-- SPIRIT_NEWS_END -->"
 
-    news_pattern = r'<!-- SPIRIT_NEWS_START -->.*?<!-- SPIRIT_NEWS_END -->'
-    if re.search(news_pattern, content, flags=re.DOTALL):
-        content = re.sub(news_pattern, new_section, content, flags=re.DOTALL)
+    if _README_NEWS_PATTERN.search(content):
+        content = _replace_section(_README_NEWS_PATTERN, new_section, content)
     else:
         insert = f"\n## 精霊が届けるニュース\n\n{new_section}\n"
         # Prefer an explicit anchor comment if present, for robust placement.
-        anchor_match = re.search(r'<!--\s*SPIRIT_NEWS_ANCHOR\s*-->', content)
+        anchor_match = _README_NEWS_ANCHOR_PATTERN.search(content)
         if anchor_match:
             start, end = anchor_match.span()
             content = content[:start] + insert + content[end:]
         else:
-            sep_match = re.search(r'\n---\s*\n', content)
+            sep_match = _README_SEPARATOR_PATTERN.search(content)
             if sep_match:
                 pos = sep_match.start()
                 content = content[:pos] + insert + content[pos:]
             else:
                 content += insert
 
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    return content
+
+
+def render_html(snapshot, previous):
+    """Render the static HTML status page."""
+    name = snapshot.profile.get("name", "精霊")
+    if snapshot.news:
+        items = []
+        for article in snapshot.news:
+            title = html.escape(article["title"])
+            source = html.escape(article["source"])
+            link = article.get("link", "")
+            # Only link http(s) URLs so a feed cannot inject javascript: or data: links
+            if link and urllib.parse.urlsplit(link).scheme in ("http", "https"):
+                items.append(_HTML_NEWS_ITEM_TEMPLATE.substitute(
+                    link=html.escape(link, quote=True), title=title, source=source,
+                ))
+            else:
+                items.append(_HTML_NEWS_ITEM_NO_LINK_TEMPLATE.substitute(
+                    title=title, source=source,
+                ))
+        news_html = "\n".join(items)
+    else:
+        news_html = "      <li>ニュースを取得できませんでした...</li>"
+
+    comment_html = ""
+    if snapshot.news_comment:
+        comment_html = "<blockquote>{}</blockquote>".format(
+            html.escape(snapshot.news_comment).replace("\n", "<br>\n")
+        )
+
+    return _HTML_TEMPLATE.substitute(
+        name=html.escape(name),
+        mood=html.escape(snapshot.mood),
+        utterance=html.escape(snapshot.utterance),
+        comment=comment_html,
+        news=news_html,
+    )
+
+
+def render_json_feed(snapshot, previous):
+    """Render the news and the spirit's comment as a JSON Feed 1.1 document."""
+    name = snapshot.profile.get("name", "精霊")
+    items = []
+    for article in snapshot.news:
+        link = article.get("link", "")
+        item = {
+            "id": link or article["title"],
+            "title": article["title"],
+            "content_text": f"{article['title']} ({article['source']})",
+        }
+        if link:
+            item["url"] = link
+        # Only the feed's own publication date; never the time of this run
+        if article.get("published"):
+            item["date_published"] = article["published"]
+        items.append(item)
+
+    feed = {
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": f"{name} のニュース",
+        "description": snapshot.news_comment,
+        "authors": [{"name": name}],
+        "items": items,
+    }
+    return json.dumps(feed, ensure_ascii=False, indent=2) + "\n"
+
+
+def render_badge(snapshot, previous):
+    """Render an SVG mood badge."""
+    label = "spirit"
+    message = snapshot.mood
+    # Approximate glyph width of 7px for the 11px Verdana used by the badge.
+    label_width = len(label) * 7 + 10
+    message_width = len(message) * 7 + 10
+    return _BADGE_TEMPLATE.substitute(
+        label=html.escape(label),
+        message=html.escape(message),
+        label_width=label_width,
+        message_width=message_width,
+        width=label_width + message_width,
+        label_x=label_width / 2,
+        message_x=label_width + message_width / 2,
+        color=MOOD_BADGE_COLORS.get(message, "#9f9f9f"),
+    )
+
+
+RENDERERS = {
+    "readme": render_readme,
+    "html": render_html,
+    "json_feed": render_json_feed,
+    "badge": render_badge,
+}
+
+
+def render_targets(snapshot, targets=None, base_dir="."):
+    """Render every configured target from one snapshot in a single pass.
+
+    Each target is rendered from the same snapshot and written only when
+    the rendered content differs from the file on disk, so unchanged state
+    leaves every target untouched.
+
+    Args:
+        snapshot: SpiritSnapshot built by build_snapshot()
+        targets: list of target dicts (default: RENDER_TARGETS).
+                 Each dict has 'format' and 'path'.
+        base_dir: directory the target paths are relative to (default: ".")
+
+    Returns:
+        list of paths that were written
+    """
+    if targets is None:
+        targets = RENDER_TARGETS
+
+    written = []
+    for target in targets:
+        renderer = RENDERERS[target["format"]]
+        path = os.path.join(base_dir, target["path"])
+
+        previous = None
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                previous = f.read()
+
+        content = renderer(snapshot, previous)
+        if content is None:
+            continue
+        if content == previous:
+            continue
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        written.append(path)
+
+    return written
 
 
 def save_spirit_data(data):
@@ -632,15 +919,19 @@ def main():
     news_items = fetch_news()
     news_comment = generate_news_comment(new_mood, spirit_data["profile"], news_items)
 
-    # Update README first (single read/write for all sections)
+    snapshot = build_snapshot(
+        spirit_data["profile"], new_mood, new_utterance, news_items, news_comment,
+    )
+
+    # Render all outputs first (README, HTML, JSON Feed, badge) from one snapshot
     # If this fails, we don't want to save the spirit data
     try:
-        update_readme(new_mood, new_utterance, news_items, news_comment)
+        written = render_targets(snapshot)
     except Exception as e:
-        print(f"エラー: READMEの更新に失敗しました: {e}", file=sys.stderr)
+        print(f"エラー: 出力の更新に失敗しました: {e}", file=sys.stderr)
         raise
 
-    # Only update spirit data if README update succeeded
+    # Only update spirit data if rendering succeeded
     spirit_data['mood'] = new_mood
     spirit_data['lastMessage'] = new_utterance
     spirit_data['lastUpdated'] = datetime.datetime.now().isoformat() + "Z"
@@ -652,12 +943,16 @@ def main():
         save_spirit_data(spirit_data)
     except Exception as e:
         print(f"エラー: .spirit.jsonの保存に失敗しました: {e}", file=sys.stderr)
-        # At this point README is updated but .spirit.json failed
-        # We re-raise to signal failure, though README remains updated
+        # At this point the outputs are updated but .spirit.json failed
+        # We re-raise to signal failure, though the outputs remain updated
         # The user will need to fix the underlying issue (e.g., permissions, disk space)
         raise
 
     print(f"精霊の状態を更新しました: {new_mood} - {new_utterance}")
+    if written:
+        print(f"出力を更新しました: {', '.join(written)}")
+    else:
+        print("出力に変更はありませんでした")
     if news_items:
         print(f"ニュースを{len(news_items)}件取得しました")
     else:
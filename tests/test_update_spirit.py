@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the render pipeline in scripts/update_spirit.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+import update_spirit  # noqa: E402
+
+
+README_TEMPLATE = """# Spirit
+
+<!-- SPIRIT_STATUS_START -->
+old
+<!-- SPIRIT_STATUS_END -->
+
+<!-- SPIRIT_LOG_START -->
+old
+<!-- SPIRIT_LOG_END -->
+
+---
+
+footer
+"""
+
+# Output of the baseline update_readme() for the same inputs
+EXPECTED_README = """# Spirit
+
+<!-- SPIRIT_STATUS_START -->
+**気分**: calm
+<!-- SPIRIT_STATUS_END -->
+
+<!-- SPIRIT_LOG_START -->
+> 静けさ
+<!-- SPIRIT_LOG_END -->
+
+## 精霊が届けるニュース
+
+<!-- SPIRIT_NEWS_START -->
+> line1
+>
+> line2
+
+- [A \\[b\\] (c)](https://e.com/a%20b%28c%29) (Blog)
+- No link (Blog)
+<!-- SPIRIT_NEWS_END -->
+
+---
+
+footer
+"""
+
+NEWS = [
+    {"source": "Blog", "title": "A [b] (c)", "link": "https://e.com/a b(c)",
+     "published": "2026-05-19T10:00:00+00:00"},
+    {"source": "Blog", "title": "No link", "link": ""},
+]
+
+PROFILE = {"name": "Kaze-no-Kami"}
+
+
+def make_snapshot(mood="calm", utterance="静けさ", news=NEWS, comment="line1\n\nline2"):
+    return update_spirit.build_snapshot(PROFILE, mood, utterance, news, comment)
+
+
+class RenderReadmeTest(unittest.TestCase):
+
+    def test_matches_baseline_output(self):
+        self.assertEqual(update_spirit.render_readme(make_snapshot(), README_TEMPLATE), EXPECTED_README)
+
+    def test_missing_readme_is_skipped(self):
+        self.assertIsNone(update_spirit.render_readme(make_snapshot(), None))
+
+    def test_no_news(self):
+        content = update_spirit.render_readme(make_snapshot(news=[], comment=""), README_TEMPLATE)
+        self.assertIn("> ニュースを取得できませんでした...", content)
+
+    def test_backslashes_are_kept_literally(self):
+        content = update_spirit.render_readme(make_snapshot(utterance="a\\1b", comment="c\\gd"), README_TEMPLATE)
+        self.assertIn("> a\\1b", content)
+        self.assertIn("> c\\gd", content)
+
+
+class RenderHtmlTest(unittest.TestCase):
+
+    def test_link_and_no_link_items(self):
+        content = update_spirit.render_html(make_snapshot(), None)
+        self.assertIn('<a href="https://e.com/a b(c)">A [b] (c)</a> (Blog)', content)
+        self.assertIn("<li>No link (Blog)</li>", content)
+        self.assertNotIn('href="#"', content)
+
+    def test_no_news(self):
+        content = update_spirit.render_html(make_snapshot(news=[], comment=""), None)
+        self.assertIn("ニュースを取得できませんでした...", content)
+        self.assertNotIn("<blockquote>line1", content)
+
+    def test_non_http_links_are_not_linked(self):
+        news = [
+            {"source": "Evil", "title": "Script", "link": "javascript:alert(1)"},
+            {"source": "Evil", "title": "Data", "link": "data:text/html,<script>alert(1)</script>"},
+        ]
+        content = update_spirit.render_html(make_snapshot(news=news), None)
+        self.assertIn("<li>Script (Evil)</li>", content)
+        self.assertIn("<li>Data (Evil)</li>", content)
+        self.assertNotIn("javascript:", content)
+        self.assertNotIn("data:", content)
+
+
+class RenderJsonFeedTest(unittest.TestCase):
+
+    def test_items_use_article_dates_only(self):
+        feed = json.loads(update_spirit.render_json_feed(make_snapshot(), None))
+        self.assertEqual(feed["description"], "line1\n\nline2")
+        self.assertEqual(feed["items"][0]["date_published"], "2026-05-19T10:00:00+00:00")
+        self.assertEqual(feed["items"][0]["url"], "https://e.com/a b(c)")
+        self.assertNotIn("date_published", feed["items"][1])
+        self.assertNotIn("url", feed["items"][1])
+
+    def test_no_news(self):
+        feed = json.loads(update_spirit.render_json_feed(make_snapshot(news=[], comment=""), None))
+        self.assertEqual(feed["items"], [])
+
+
+class RenderBadgeTest(unittest.TestCase):
+
+    def test_badge_is_valid_svg(self):
+        root = ET.fromstring(update_spirit.render_badge(make_snapshot(news=[]), None))
+        self.assertEqual(root.get("aria-label"), "spirit: calm")
+
+
+class RenderTargetsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base_dir = self.tmp.name
+        with open(os.path.join(self.base_dir, "README.md"), "w", encoding="utf-8") as f:
+            f.write(README_TEMPLATE)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _written(self, snapshot):
+        written = update_spirit.render_targets(snapshot, base_dir=self.base_dir)
+        return sorted(os.path.relpath(path, self.base_dir) for path in written)
+
+    def test_writes_all_targets_then_skips_unchanged(self):
+        all_targets = sorted(os.path.normpath(t["path"]) for t in update_spirit.RENDER_TARGETS)
+        self.assertEqual(self._written(make_snapshot()), all_targets)
+        self.assertEqual(self._written(make_snapshot()), [])
+
+    def test_mood_change_rewrites_only_dependent_targets(self):
+        self._written(make_snapshot())
+        self.assertEqual(self._written(make_snapshot(mood="excited")),
+                         sorted(["README.md", os.path.join("docs", "index.html"),
+                                 os.path.join("docs", "mood.svg")]))
+
+    def test_missing_readme_is_not_created(self):
+        os.remove(os.path.join(self.base_dir, "README.md"))
+        self.assertNotIn("README.md", self._written(make_snapshot()))
+        self.assertFalse(os.path.exists(os.path.join(self.base_dir, "README.md")))
+
+
+class ParseRssDateTest(unittest.TestCase):
+
+    def test_rfc822_to_rfc3339(self):
+        self.assertEqual(update_spirit._parse_rss_date("Tue, 19 May 2026 10:00:00 +0000"),
+                         "2026-05-19T10:00:00+00:00")
+
+    def test_unknown_zone_is_utc(self):
+        self.assertEqual(update_spirit._parse_rss_date("Tue, 19 May 2026 10:00:00 -0000"),
+                         "2026-05-19T10:00:00+00:00")
+        self.assertEqual(update_spirit._parse_rss_date("Tue, 19 May 2026 10:00:00"),
+                         "2026-05-19T10:00:00+00:00")
+
+    def test_invalid_or_missing(self):
+        self.assertIsNone(update_spirit._parse_rss_date(None))
+        self.assertIsNone(update_spirit._parse_rss_date("not a date"))
+
+
+if __name__ == "__main__":
+    unittest.main()